@@ -18,10 +18,14 @@ v2 fixes (July 2026 audit):
    as fresh data. The dashboard reads these fields to show stale badges.
 """
 
+import hashlib
 import json
+import math
 import re
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from urllib.request import urlopen, Request
 from urllib.parse import quote
@@ -44,7 +48,8 @@ def _via_scraper_api(url):
             + "&premium=true&country_code=us&render=true"
             + "&url=" + quote(url, safe=""))
 
-SIZES = ["5x10", "10x10", "10x15", "10x20", "10x30"]
+SIZES = ("5x10", "10x10", "10x15", "10x20", "10x30")
+SIZES_SET = frozenset(SIZES)
 
 # Text that marks a listing as vehicle parking, not an enclosed unit.
 # "Uncovered" marks true parking spaces. Enclosed drive-up units that allow
@@ -57,6 +62,18 @@ def now_utc():
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
 
+def save_json(path, data):
+    """
+    Write `data` to `path` via a temp file and os.replace(), so a crash or
+    timeout mid-write leaves the previous file intact instead of a truncated
+    one that breaks the next run's json.load.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
 USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
               "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
 
@@ -98,6 +115,10 @@ def _fetch_static(url, timeout=30):
         return None
 
 
+REVEAL_TOGGLE_RE = re.compile(
+    r"show\s+.*units|view\s+all\s+units|see\s+prices|show\s+units", re.I)
+
+
 def _reveal_units(page):
     """
     Some sites (e.g. SmartStop) hide unit pricing behind 'Show ... Units' /
@@ -106,9 +127,7 @@ def _reveal_units(page):
     raises.
     """
     try:
-        toggles = page.get_by_text(
-            re.compile(r"show\s+.*units|view\s+all\s+units|see\s+prices|show\s+units", re.I)
-        )
+        toggles = page.get_by_text(REVEAL_TOGGLE_RE)
         for i in range(min(toggles.count(), 12)):
             try:
                 toggles.nth(i).click(timeout=2500)
@@ -119,7 +138,7 @@ def _reveal_units(page):
         pass
 
 
-def fetch(url, timeout=45):
+def _fetch_live(url, timeout=45):
     """
     Fetch fully-rendered HTML using headless Chromium so JavaScript-rendered
     prices (SmartStop, Public Storage, Lockaway, etc.) actually appear.
@@ -128,16 +147,16 @@ def fetch(url, timeout=45):
     # Hosts that block CI IPs: route through the residential scraping API (if a
     # key is set). Their prices are server-rendered, so no JS render is needed.
     if SCRAPER_API_KEY and any(h in url for h in PROXY_HOSTS):
-        print("  routing via ScraperAPI (residential IP + JS render)")
+        print(f"  routing {url} via ScraperAPI (residential IP + JS render)")
         html = _fetch_static(_via_scraper_api(url), timeout=120)
         if html:
             return html
-        print("  NOTE: ScraperAPI fetch empty; falling back to direct")
+        print(f"  NOTE: ScraperAPI fetch empty for {url}; falling back to direct")
 
     try:
         from playwright.sync_api import sync_playwright
     except Exception:
-        print("  NOTE: Playwright unavailable, using static fetch")
+        print(f"  NOTE: Playwright unavailable, using static fetch for {url}")
         return _fetch_static(url, timeout)
 
     try:
@@ -161,176 +180,324 @@ def fetch(url, timeout=45):
         return _fetch_static(url, timeout)
 
 
+# Same-day page cache: reruns (debugging, a re-run Action) reuse the HTML
+# already fetched today instead of hitting the competitor sites again.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+CACHE_MAX_AGE_DAYS = 7
+
+
+def _cache_path(url):
+    day = datetime.now(timezone.utc).strftime("%Y%m%d")
+    return os.path.join(CACHE_DIR, f"{day}-{hashlib.sha1(url.encode()).hexdigest()}.html")
+
+
+def prune_cache():
+    """Delete cached pages older than CACHE_MAX_AGE_DAYS. Best-effort."""
+    cutoff = time.time() - CACHE_MAX_AGE_DAYS * 86400
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def cache_page(url, html):
+    """
+    Store `html` as today's cached copy of `url`. main() calls this only after
+    the page parsed OK with at least one price, so a block page, unrendered
+    fallback or empty render is refetched on the next run instead of being
+    replayed for the rest of the day. Best-effort.
+    """
+    path = _cache_path(url)
+    if os.path.exists(path):
+        return
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.replace(tmp, path)
+    except (OSError, ValueError) as e:
+        # ValueError covers UnicodeEncodeError: rendered pages can contain a
+        # lone surrogate (JS-truncated emoji) that UTF-8 cannot encode.
+        print(f"  NOTE: could not cache {url}: {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def fetch(url, timeout=45):
+    """Page HTML for `url`, from today's cache if present, else live."""
+    path = _cache_path(url)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        print(f"  cached: {url}")
+        return html
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        # Unreadable or undecodable entry: drop it and fetch live instead.
+        print(f"  NOTE: ignoring bad cache entry for {url}: {e}")
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return _fetch_live(url, timeout)
+
+
+# Upper bound on pages fetched at once; each may be a headless Chromium.
+FETCH_WORKERS = 8
+
+
+def fetch_all(urls):
+    """
+    Fetch every page concurrently. fetch() is blocking I/O (Playwright's sync
+    API or a plain HTTP GET), so a thread pool overlaps the network waits and
+    the run takes roughly as long as the slowest site instead of the sum.
+    Returns {url: html}, with None for any page that could not be fetched.
+    A URL listed more than once is fetched once.
+    """
+    urls = list(dict.fromkeys(urls))
+    print(f"\nFETCH {len(urls)} page(s) concurrently...")
+    pages = {}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        futures = {url: pool.submit(fetch, url) for url in urls}
+        for url, fut in futures.items():
+            try:
+                pages[url] = fut.result()
+            except Exception as e:
+                print(f"  WARNING: fetch crashed for {url}: {e}")
+                pages[url] = None
+    return pages
+
+
+# Script/style bodies go first, in their own pass, so a stray "<" in page text
+# can never start a tag match that swallows an opening <script>.
+SCRIPT_STYLE_RE = re.compile(r"<script[\s\S]*?</script>|<style[\s\S]*?</style>", re.I)
+TAG_RE = re.compile(r"<[^>]+>|&nbsp;|&#160;")
+ENTITY_RE = re.compile(r"&#0?39;|&apos;|&rsquo;|&amp;")
+
+
 def strip_tags(html):
     """Crude HTML-to-text so card segmentation follows what a human sees."""
-    text = re.sub(r"<script[\s\S]*?</script>", " ", html, flags=re.I)
-    text = re.sub(r"<style[\s\S]*?</style>", " ", text, flags=re.I)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"&nbsp;|&#160;", " ", text)
-    text = re.sub(r"&#0?39;|&apos;|&rsquo;", "'", text)
-    text = re.sub(r"&amp;", "&", text)
-    return re.sub(r"\s+", " ", text)
+    text = TAG_RE.sub(" ", SCRIPT_STYLE_RE.sub(" ", html))
+    text = " ".join(text.split())  # collapse whitespace in C, not one regex match per run
+    # Entities are decoded last, on text that is already a fraction of the page.
+    return ENTITY_RE.sub(lambda m: "&" if m.group() == "&amp;" else "'", text)
+
+
+# Quantifiers are kept unambiguous (no `\s*'?\s*`): when two adjacent runs can
+# both absorb the same whitespace, a failed match retries every split of it.
+DIM_RE = re.compile(r"(\d{1,2})\s*(?:'\s*)?[xX\u00d7]\s*(\d{1,2})\s*'?")
 
 
-DIM_RE = re.compile(r"(\d{1,2})\s*'?\s*[xX\u00d7]\s*(\d{1,2})\s*'?")
+def size_key(a, b):
+    """Normalized size key, smaller side first: (10, 5) -> "5x10"."""
+    return f"{a}x{b}" if a <= b else f"{b}x{a}"
 
 
 def segment_cards(html):
     """
     Split page text into per-unit 'cards'. Each card runs from one dimension
     occurrence to the next, so prices can never bleed between cards.
-    Returns a list of (norm_size_key, card_text, prefix_text).
+    Yields (norm_size_key, card_text) lazily, one card behind the dimension
+    scan, so no list of cards is ever built.
     """
     text = strip_tags(html)
-    hits = [(m.start(), int(m.group(1)), int(m.group(2))) for m in DIM_RE.finditer(text)]
-    cards = []
-    for i, (pos, a, b) in enumerate(hits):
-        end = hits[i + 1][0] if i + 1 < len(hits) else min(len(text), pos + 400)
-        prev_end = hits[i - 1][0] if i > 0 else 0
-        prefix = text[max(prev_end, pos - 200):pos]
-        lo, hi = sorted((a, b))
-        cards.append((f"{lo}x{hi}", text[pos:end], prefix))
-    return cards
+    key = pos = None
+    for m in DIM_RE.finditer(text):
+        if key is not None:
+            yield key, text[pos:m.start()]
+        key, pos = size_key(int(m.group(1)), int(m.group(2))), m.start()
+    if key is not None:
+        yield key, text[pos:pos + 400]
+
+
+def dollars(price):
+    """
+    Whole dollars from a captured price string ("82", "82.5", "82.50"),
+    rounded exactly as round(float(price)) would (half to even) but without
+    building a float per match.
+    """
+    whole, _, cents = price.partition(".")
+    val = int(whole)
+    if cents:
+        c = int(cents.ljust(2, "0"))
+        if c > 50 or (c == 50 and val % 2):
+            val += 1
+    return val
+
+
+CARD_PRICE_RE = re.compile(r"\$\s*(\d+(?:\.\d{1,2})?)")
 
 
 def card_prices(card_text):
     """All whole-dollar prices in a card, low to high."""
-    vals = [round(float(p)) for p in re.findall(r"\$\s*(\d+(?:\.\d{1,2})?)", card_text)]
+    vals = [dollars(p) for p in CARD_PRICE_RE.findall(card_text)]
     return sorted(v for v in vals if v > 1)  # ignore the $1 promo figure
 
 
 def empty_pricing():
-    return {s: None for s in SIZES}
-
-
-def keep_lowest(size_prices, key, val):
-    if key not in size_prices or val < size_prices[key]:
-        size_prices[key] = val
+    return dict.fromkeys(SIZES)
 
 
-# --- Scrapers ----------------------------------------------------------------
-# Each scraper returns (pricing_dict, status) where status is "ok"|"blocked"|"failed".
-
-def scrape_lockaway(url):
-    """Lockaway: multiple cards per size; use lowest advertised (online/starting)."""
-    html = fetch(url)
+def parse_cards(html, size_map, read_card):
+    """
+    Shared card loop for the segment-based parsers. `size_map` maps a page's
+    normalized size key to one of SIZES; `read_card(card_text)` returns
+    (value, pricing_full_entry) or None to skip the card. Per size, the card
+    with the lowest value wins.
+    """
     if html is None:
         return None, "failed"
     if "$" not in html:
         return None, "blocked"
 
-    lockaway_map = {
-        "5x10": "5x10", "8x10": "5x10",
-        "10x10": "10x10",
-        "10x15": "10x15", "8x15": "10x15",
-        "10x20": "10x20", "8x20": "10x20",
-        "10x30": "10x30", "12x30": "10x30",
-    }
     size_prices = {}
     size_full = {}
-    for key, card, prefix in segment_cards(html):
-        mapped = lockaway_map.get(key)
+    for key, card in segment_cards(html):
+        mapped = size_map.get(key)
         if not mapped:
             continue
-        prices = card_prices(card)
-        if prices:
-            promo, regular = prices[0], prices[-1]
-            if mapped not in size_prices or promo < size_prices[mapped]:
-                size_prices[mapped] = promo
-                size_full[mapped] = {"regular": regular, "promo": promo}
+        read = read_card(card)
+        if read is None:
+            continue
+        val, full = read
+        if val < size_prices.get(mapped, math.inf):
+            size_prices[mapped] = val
+            size_full[mapped] = full
 
     pricing = empty_pricing()
-    pricing.update({s: p for s, p in size_prices.items() if s in pricing})
+    pricing.update(size_prices)
     return {"pricing": pricing, "pricingFull": size_full}, "ok"
 
 
-def scrape_public_storage(url, facility_name):
+def _single_price(val):
+    """Card reading for sites that show one price per card."""
+    return val, {"regular": val, "promo": None}
+
+
+# --- Parsers -----------------------------------------------------------------
+# Each parser takes the fetched HTML (None if the fetch failed) and returns
+# (pricing_dict, status) where status is "ok"|"blocked"|"failed".
+
+# Page size -> standard size, per site. Sites listing only standard sizes use
+# STANDARD_MAP; the others fold near-equivalent units into the closest one.
+STANDARD_MAP = {s: s for s in SIZES}
+LOCKAWAY_MAP = {
+    "5x10": "5x10", "8x10": "5x10",
+    "10x10": "10x10",
+    "10x15": "10x15", "8x15": "10x15",
+    "10x20": "10x20", "8x20": "10x20",
+    "10x30": "10x30", "12x30": "10x30",
+}
+PS_MAP = {
+    "5x9": "5x10", "5x10": "5x10", "5x14": "5x10", "5x15": "5x10",
+    "7x14": "10x10", "8x14": "10x10", "10x10": "10x10",
+    "10x15": "10x15", "7x19": "10x15",
+    "10x19": "10x20", "10x20": "10x20",
+    "10x30": "10x30",
+}
+WOODLANDS_MAP = {
+    "10x10": "10x10", "10x12": "10x10",
+    "10x20": "10x20",
+    "10x30": "10x30", "12x30": "10x30",
+}
+
+
+def _read_lockaway_card(card):
+    prices = card_prices(card)
+    if prices:
+        promo, regular = prices[0], prices[-1]
+        return promo, {"regular": regular, "promo": promo}
+    return None
+
+
+def parse_lockaway(html):
+    """Lockaway: multiple cards per size; use lowest advertised (online/starting)."""
+    return parse_cards(html, LOCKAWAY_MAP, _read_lockaway_card)
+
+
+# Public Storage cards show an online-only rate and an in-store rate. One
+# pattern matches either label, so each card is scanned once for both.
+PS_RATE_RE = re.compile(r"(?:(?P<online>Online[\s-]*(?:Only\s*)?[Pp]rice)|(?i:In\s*Store))"
+                        r"\s*\$\s*(?P<price>\d+(?:\.\d{1,2})?)")
+
+
+def _read_public_storage_card(card):
+    # Only full unit cards carry a "Features" list; the page also renders
+    # bare summary rows (dimension + price, no features). Summary rows are
+    # skipped because they cannot be checked for the Uncovered/parking flag.
+    if "Features" not in card:
+        return None
+    if PARKING_RE.search(card):
+        return None  # "Uncovered" = a parking space, not an enclosed unit
+    # Capture both figures: online-only (promo) and in-store (regular).
+    online = instore = None
+    for m in PS_RATE_RE.finditer(card):
+        if m.group("online"):
+            online = online or m.group("price")
+        else:
+            instore = instore or m.group("price")
+        if online and instore:
+            break
+    eff = online or instore
+    if not eff:
+        return None
+    val = dollars(eff)
+    return val, {
+        "regular": dollars(instore) if instore else val,
+        "promo": dollars(online) if online else None,
+    }
+
+
+def parse_public_storage(html, facility_name):
     """
     Public Storage: full unit cards carry a Features list and both an
     online-only rate and an in-store rate. Use the online rate per size.
     EXCLUDE uncovered parking listings.
     """
-    html = fetch(url)
-    if html is None:
-        return None, "failed"
-    if "$" not in html:
-        return None, "blocked"
+    return parse_cards(html, PS_MAP, _read_public_storage_card)
 
-    ps_map = {
-        "5x9": "5x10", "5x10": "5x10", "5x14": "5x10", "5x15": "5x10",
-        "7x14": "10x10", "8x14": "10x10", "10x10": "10x10",
-        "10x15": "10x15", "7x19": "10x15",
-        "10x19": "10x20", "10x20": "10x20",
-        "10x30": "10x30",
-    }
-    size_prices = {}
-    size_full = {}
-    for key, card, prefix in segment_cards(html):
-        mapped = ps_map.get(key)
-        if not mapped:
-            continue
-        # Only full unit cards carry a "Features" list; the page also renders
-        # bare summary rows (dimension + price, no features). Summary rows are
-        # skipped because they cannot be checked for the Uncovered/parking flag.
-        if "Features" not in card:
-            continue
-        if PARKING_RE.search(card):
-            continue  # "Uncovered" = a parking space, not an enclosed unit
-        # Capture both figures: online-only (promo) and in-store (regular).
-        mo = re.search(r"Online[\s-]*(?:Only)?\s*[Pp]rice\s*\$\s*(\d+(?:\.\d{1,2})?)", card)
-        mi = re.search(r"In\s*Store\s*\$\s*(\d+(?:\.\d{1,2})?)", card, re.I)
-        eff = mo or mi
-        if eff:
-            val = round(float(eff.group(1)))
-            if mapped not in size_prices or val < size_prices[mapped]:
-                size_prices[mapped] = val
-                size_full[mapped] = {
-                    "regular": round(float(mi.group(1))) if mi else val,
-                    "promo": round(float(mo.group(1))) if mo else None,
-                }
 
-    pricing = empty_pricing()
-    pricing.update({s: p for s, p in size_prices.items() if s in pricing})
-    return {"pricing": pricing, "pricingFull": size_full}, "ok"
+JSON_DATA_RE = re.compile(r"window\.JSON_DATA\s*=\s*")
+_JSON_DECODER = json.JSONDecoder()
 
 
 def _extract_json_data(html):
-    """Pull the `window.JSON_DATA = {...}` object out of SmartStop's HTML via a
-    balanced-brace scan (the object is deeply nested, so regex won't do)."""
-    m = re.search(r"window\.JSON_DATA\s*=\s*", html)
+    """Pull the `window.JSON_DATA = {...}` object out of SmartStop's HTML.
+    raw_decode() parses one JSON value starting at the opening brace and stops
+    at its matching close, so the deeply nested object needs no brace scan."""
+    m = JSON_DATA_RE.search(html)
     if not m:
         return None
     start = html.find("{", m.end())
     if start == -1:
         return None
-    depth = 0
-    in_str = False
-    esc = False
-    for i in range(start, len(html)):
-        ch = html[i]
-        if in_str:
-            if esc:
-                esc = False
-            elif ch == "\\":
-                esc = True
-            elif ch == '"':
-                in_str = False
-        else:
-            if ch == '"':
-                in_str = True
-            elif ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    try:
-                        return json.loads(html[start:i + 1])
-                    except Exception:
-                        return None
-    return None
+    try:
+        return _JSON_DECODER.raw_decode(html, start)[0]
+    except Exception:
+        return None
 
 
-def scrape_smartstop(url):
+# Older SmartStop markup, before unit data moved into window.JSON_DATA.
+SMARTSTOP_INSTORE_RE = re.compile(r"In-?Store\s*\$\s*(\d+(?:\.\d{1,2})?)", re.I)
+
+
+def _read_smartstop_legacy_card(card):
+    m = SMARTSTOP_INSTORE_RE.search(card)
+    return _single_price(dollars(m.group(1))) if m else None
+
+
+def parse_smartstop(html):
     """
     SmartStop is an Umbraco site that ships unit data inside a `window.JSON_DATA`
     blob rather than the rendered DOM. Read locationDetail.location.units[] and
@@ -339,7 +506,6 @@ def scrape_smartstop(url):
     with no prices instead of pretending old numbers are current.
     Falls back to the legacy 'In-Store $' regex if the blob isn't present.
     """
-    html = fetch(url)
     if html is None:
         return None, "failed"
 
@@ -355,15 +521,13 @@ def scrape_smartstop(url):
             l = u.get("length") or u.get("unitLength")
             key = None
             if w and l:
-                lo, hi = sorted((int(float(w)), int(float(l))))
-                key = f"{lo}x{hi}"
+                key = size_key(int(float(w)), int(float(l)))
             else:
                 nm = str(u.get("size") or u.get("unitTypeName") or u.get("name") or "")
                 dm = DIM_RE.search(nm)
                 if dm:
-                    lo, hi = sorted((int(dm.group(1)), int(dm.group(2))))
-                    key = f"{lo}x{hi}"
-            if key not in SIZES:
+                    key = size_key(int(dm.group(1)), int(dm.group(2)))
+            if key not in SIZES_SET:
                 continue
             web = (u.get("webRate") or u.get("pushRate") or u.get("onlineRate")
                    or u.get("rate") or u.get("price"))
@@ -371,7 +535,7 @@ def scrape_smartstop(url):
                 continue
             web = round(float(web))
             std = u.get("standardRate") or u.get("streetRate") or u.get("inStoreRate") or web
-            if key not in size_prices or web < size_prices[key]:
+            if web < size_prices.get(key, math.inf):
                 size_prices[key] = web
                 size_full[key] = {"regular": round(float(std)), "promo": web if web < float(std) else None}
         pricing = empty_pricing()
@@ -381,39 +545,20 @@ def scrape_smartstop(url):
         return {"pricing": pricing, "pricingFull": size_full}, "ok"
 
     # Legacy fallback (older markup with visible In-Store prices).
-    if "$" not in html:
-        return None, "blocked"
-    size_prices = {}
-    for key, card, prefix in segment_cards(html):
-        if key not in SIZES:
-            continue
-        m = re.search(r"In-?Store\s*\$\s*(\d+(?:\.\d{1,2})?)", card, re.I)
-        if m:
-            keep_lowest(size_prices, key, round(float(m.group(1))))
-    pricing = empty_pricing()
-    pricing.update(size_prices)
-    return {"pricing": pricing, "pricingFull": {s: {"regular": p, "promo": None} for s, p in size_prices.items()}}, "ok"
+    return parse_cards(html, STANDARD_MAP, _read_smartstop_legacy_card)
 
 
-def scrape_honea_egypt(url):
-    """Honea Egypt: '$82.00/month' near dimensions; reversed dims normalized."""
-    html = fetch(url)
-    if html is None:
-        return None, "failed"
-    if "$" not in html:
-        return None, "blocked"
+HONEA_PRICE_RE = re.compile(r"\$\s*(\d+(?:\.\d{1,2})?)\s*(?:/\s*)?month", re.I)
 
-    size_prices = {}
-    for key, card, prefix in segment_cards(html):
-        if key not in SIZES:
-            continue
-        m = re.search(r"\$\s*(\d+(?:\.\d{1,2})?)\s*/?\s*month", card, re.I)
-        if m:
-            keep_lowest(size_prices, key, round(float(m.group(1))))
 
-    pricing = empty_pricing()
-    pricing.update(size_prices)
-    return {"pricing": pricing, "pricingFull": {s: {"regular": p, "promo": None} for s, p in size_prices.items()}}, "ok"
+def _read_honea_card(card):
+    m = HONEA_PRICE_RE.search(card)
+    return _single_price(dollars(m.group(1))) if m else None
+
+
+def parse_honea_egypt(html):
+    """Honea Egypt: '$82.00/month' near dimensions; reversed dims normalized."""
+    return parse_cards(html, STANDARD_MAP, _read_honea_card)
 
 
 # Montgomery unit prices are formatted "$260.00/mo"; its promo banner uses
@@ -423,61 +568,32 @@ def scrape_honea_egypt(url):
 MONTGOMERY_PRICE_RE = re.compile(r"\$\s*(\d+\.\d{2})\s*/\s*mo\b", re.I)
 
 
-def scrape_montgomery(url):
+def _read_montgomery_card(card):
+    prices = [dollars(p) for p in MONTGOMERY_PRICE_RE.findall(card)]
+    return _single_price(min(prices)) if prices else None
+
+
+def parse_montgomery(html):
     """Montgomery: climate and non-climate; keep cheapest (non-climate) per size."""
-    html = fetch(url)
-    if html is None:
-        return None, "failed"
-    if "$" not in html:
-        return None, "blocked"
+    return parse_cards(html, STANDARD_MAP, _read_montgomery_card)
 
-    size_prices = {}
-    for key, card, prefix in segment_cards(html):
-        if key not in SIZES:
-            continue
-        prices = sorted(round(float(p)) for p in MONTGOMERY_PRICE_RE.findall(card))
-        if prices:
-            keep_lowest(size_prices, key, prices[0])
 
-    pricing = empty_pricing()
-    pricing.update(size_prices)
-    return {"pricing": pricing, "pricingFull": {s: {"regular": p, "promo": None} for s, p in size_prices.items()}}, "ok"
+def _read_woodlands_card(card):
+    prices = card_prices(card)
+    if prices:
+        regular = prices[-1]  # highest in this card = regular price
+        promo = prices[0] if len(prices) > 1 else None
+        return regular, {"regular": regular, "promo": promo}
+    return None
 
 
-def scrape_woodlands_sao(url):
+def parse_woodlands_sao(html):
     """
     Woodlands SAO: each card shows promo and regular prices. Rule: use the
     REGULAR price (highest within the card); across multiple cards of the
     same size, use the cheapest regular.
     """
-    html = fetch(url)
-    if html is None:
-        return None, "failed"
-    if "$" not in html:
-        return None, "blocked"
-
-    woodlands_map = {
-        "10x10": "10x10", "10x12": "10x10",
-        "10x20": "10x20",
-        "10x30": "10x30", "12x30": "10x30",
-    }
-    size_prices = {}
-    size_full = {}
-    for key, card, prefix in segment_cards(html):
-        mapped = woodlands_map.get(key)
-        if not mapped:
-            continue
-        prices = card_prices(card)
-        if prices:
-            regular = prices[-1]  # highest in this card = regular price
-            promo = prices[0] if len(prices) > 1 else None
-            if mapped not in size_prices or regular < size_prices[mapped]:
-                size_prices[mapped] = regular
-                size_full[mapped] = {"regular": regular, "promo": promo}
-
-    pricing = empty_pricing()
-    pricing.update({s: p for s, p in size_prices.items() if s in pricing})
-    return {"pricing": pricing, "pricingFull": size_full}, "ok"
+    return parse_cards(html, WOODLANDS_MAP, _read_woodlands_card)
 
 
 # --- Main --------------------------------------------------------------------
@@ -488,6 +604,7 @@ def main():
     print(f"Run time: {now_utc()}")
     print("=" * 60)
     ensure_playwright()
+    prune_cache()
 
     data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data.json")
 
@@ -500,30 +617,33 @@ def main():
     scrape_targets = [
         {"name": "Lockaway Storage",
          "url": "https://www.lockaway-storage.com/storage-units/texas/magnolia/lockaway-storage-1488-411002/",
-         "scraper": scrape_lockaway},
+         "parser": parse_lockaway},
         {"name": "Public Storage (FM 1488)",
          "url": "https://www.publicstorage.com/self-storage-tx-magnolia/2360.html",
-         "scraper": lambda u: scrape_public_storage(u, "Public Storage (FM 1488)")},
+         "parser": lambda h: parse_public_storage(h, "Public Storage (FM 1488)")},
         {"name": "Public Storage (FM 2978)",
          "url": "https://www.publicstorage.com/self-storage-tx-the-woodlands/5888.html",
-         "scraper": lambda u: scrape_public_storage(u, "Public Storage (FM 2978)")},
+         "parser": lambda h: parse_public_storage(h, "Public Storage (FM 2978)")},
         {"name": "SmartStop Self Storage",
          "url": "https://smartstopselfstorage.com/find-storage/tx/magnolia/32620-fm-2978",
-         "scraper": scrape_smartstop},
+         "parser": parse_smartstop},
         {"name": "Honea Egypt Self Storage",
          "url": "https://www.honeaegyptselfstorage.com/find-storage.aspx?id=68",
-         "scraper": scrape_honea_egypt},
+         "parser": parse_honea_egypt},
         {"name": "Montgomery Self Storage",
          "url": "https://montgomeryss.com/locations/magnolia-tx/",
-         "scraper": scrape_montgomery},
+         "parser": parse_montgomery},
         {"name": "Woodlands Storage & Office",
          "url": "https://www.woodlandssao.com/units",
-         "scraper": scrape_woodlands_sao},
+         "parser": parse_woodlands_sao},
         {"name": "Storage King USA",
          "url": None,  # RV/boat parking only, no enclosed units
-         "scraper": None},
+         "parser": None},
     ]
 
+    urls = [t["url"] for t in scrape_targets if t["parser"] is not None]
+    pages = fetch_all(urls)
+
     existing = {c["name"]: c for c in data.get("competitors", [])}
     changes = []
 
@@ -532,13 +652,13 @@ def main():
         entry = existing.setdefault(name, {"name": name, "pricing": empty_pricing()})
         old_pricing = entry.get("pricing", empty_pricing())
 
-        if target["scraper"] is None:
+        if target["parser"] is None:
             print(f"\nSKIP {name} (no enclosed-unit pricing)")
             entry["scrapeStatus"] = "n/a"
             continue
 
         print(f"\nSCAN {name}...")
-        result, status = target["scraper"](target["url"])
+        result, status = target["parser"](pages[target["url"]])
         new_pricing = result["pricing"] if result else None
         new_full = result.get("pricingFull", {}) if result else {}
 
@@ -566,13 +686,12 @@ def main():
         entry["lastVerified"] = now_utc()
         found = sum(1 for v in new_pricing.values() if v is not None)
         print(f"  OK {name}: {found} prices found")
+        if found:
+            cache_page(target["url"], pages[target["url"]])
 
     data["lastUpdated"] = now_utc()
     data["competitors"] = [existing[t["name"]] for t in scrape_targets if t["name"] in existing]
 
-    with open(data_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
     # --- Price history: one snapshot per day inside data.json (effective rate per size) ---
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     snapshot = {
@@ -585,8 +704,7 @@ def main():
         snaps[-1] = snapshot  # same-day rerun replaces
     else:
         snaps.append(snapshot)
-    with open(data_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    save_json(data_path, data)
     print(f"HISTORY: {len(snaps)} snapshot(s), latest {today}")
 
     print("\n" + "=" * 60)
@@ -598,6 +716,14 @@ def main():
         print("NO CHANGES: All prices unchanged")
     print(f"SAVED: {data_path}")
     print("=" * 60)
+
+    # Fail the Action when every scraper came back unverified (all blocked or
+    # failed), so a dead run shows red instead of silently going green. The
+    # workflow still commits data.json, so the dashboard shows the stale badges.
+    scanned = [t["name"] for t in scrape_targets if t["parser"] is not None]
+    if scanned and all(existing[n].get("scrapeStatus") != "ok" for n in scanned):
+        print("ERROR: no competitor could be verified this run")
+        return 1
     return 0
 
 